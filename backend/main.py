@@ -1,24 +1,78 @@
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from typing import List, Dict, Any, Callable, NamedTuple, Optional, Tuple
+import asyncio
+from contextlib import asynccontextmanager
+import msgspec
+import math
+import os
 import numpy as np
+from numba import njit
 import time
 import json
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from types import MappingProxyType
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("api_latency.log")
-    ]
-)
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, handlers=[logging.StreamHandler()])
 logger = logging.getLogger("trade-simulator")
 
-app = FastAPI(title="GoQuant Trade Simulator API")
+# File writes go through a queue and are flushed by a background listener thread
+# so that request handlers never block on disk I/O. The queue handler is only
+# attached while the listener runs (see lifespan), so records can't pile up
+log_queue = queue.Queue(-1)
+file_log_handler = QueueHandler(log_queue)
+file_log_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+log_listener = QueueListener(log_queue, logging.FileHandler("api_latency.log", delay=True))
+
+def available_cpus() -> int:
+    """Number of CPUs this process may run on (honours cpusets / taskset and cgroup v2
+    CPU quotas such as docker run --cpus, unlike os.cpu_count())"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # sched_getaffinity is Linux-only
+        cpus = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):  # no cgroup v2 CPU controller
+        pass
+    return cpus
+
+# Number of uvicorn worker processes sharing the CPUs; WEB_CONCURRENCY is uvicorn's own setting
+WORKER_COUNT = max(1, int(os.environ.get("WEB_CONCURRENCY", 1)))
+
+# Size of the thread pool for the CPU-bound part of /simulate, which keeps it off the
+# event loop; _simulate_kernel releases the GIL so simulations run in parallel across
+# threads. Each worker gets its share of the CPUs so N workers don't start N * cpus threads
+CPU_POOL_SIZE = max(1, available_cpus() // WORKER_COUNT)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Compile (or load from Numba's on-disk cache) the kernels here rather than at import,
+    # so the first request doesn't pay for it and a worker supervisor never does
+    warm_up_kernels()
+    log_listener.start()
+    logging.getLogger().addHandler(file_log_handler)
+    # Owned by this lifespan so every startup gets a fresh pool
+    app.state.cpu_pool = ThreadPoolExecutor(max_workers=CPU_POOL_SIZE)
+    try:
+        yield
+    finally:
+        app.state.cpu_pool.shutdown(wait=False)
+        logging.getLogger().removeHandler(file_log_handler)
+        log_listener.stop()
+
+app = FastAPI(title="GoQuant Trade Simulator API", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -30,31 +84,70 @@ app.add_middleware(
 )
 
 # Models
-class OrderbookEntry(BaseModel):
+# Request models are msgspec structs: the orderbook can hold hundreds of levels
+# and msgspec decodes them straight from JSON much faster than Pydantic
+class OrderbookEntry(msgspec.Struct):
     price: float
     size: float
     total: float
     percentage: float
 
-class OrderbookData(BaseModel):
+class OrderbookData(msgspec.Struct):
     bids: List[OrderbookEntry]
     asks: List[OrderbookEntry]
     spread: float
     spreadPercentage: float
     timestamp: int
 
-class TradeParameters(BaseModel):
+class FeeTier(str, Enum):
+    STANDARD = "standard"
+    BASIC = "basic"
+    VIP1 = "vip1"
+    VIP2 = "vip2"
+    VIP3 = "vip3"
+    VIP = "vip"
+
+class TradeParametersBase(msgspec.Struct):
     symbol: str
-    orderSize: float
-    feeTier: str
+    feeTier: FeeTier
     executionStrategy: str
     volatility: Optional[float] = None
     urgency: Optional[str] = None
 
-class SimulationRequest(BaseModel):
+class TradeParameters(TradeParametersBase, kw_only=True):
+    orderSize: float
+
+class SimulationRequest(msgspec.Struct):
     orderbook: OrderbookData
     parameters: TradeParameters
-    clientTimestamp: int = Field(..., description="Client timestamp for latency calculation")
+    clientTimestamp: int  # Client timestamp for latency calculation
+
+class BatchTradeParameters(TradeParametersBase):
+    pass
+
+class SimulationBatchRequest(msgspec.Struct):
+    orderbook: OrderbookData
+    parameters: BatchTradeParameters
+    orderSizes: List[float]
+    clientTimestamp: int  # Client timestamp for latency calculation
+
+# strict=False keeps the lax coercion Pydantic applied (e.g. "1" -> 1.0, 1.0 -> 1)
+simulation_request_decoder = msgspec.json.Decoder(SimulationRequest, strict=False)
+simulation_batch_request_decoder = msgspec.json.Decoder(SimulationBatchRequest, strict=False)
+
+# Expose the msgspec request schemas in the OpenAPI docs
+(simulation_request_schema, simulation_batch_request_schema), request_schema_components = msgspec.json.schema_components(
+    [SimulationRequest, SimulationBatchRequest], ref_template="#/components/schemas/{name}"
+)
+default_openapi = app.openapi
+
+def openapi_with_request_models() -> Dict[str, Any]:
+    if app.openapi_schema is None:
+        schema = default_openapi()
+        schema.setdefault("components", {}).setdefault("schemas", {}).update(request_schema_components)
+    return app.openapi_schema
+
+app.openapi = openapi_with_request_models
 
 class LatencyMetrics(BaseModel):
     serverProcessingTime: float
@@ -69,44 +162,66 @@ class SimulationResponse(BaseModel):
     makerTakerProbability: float
     latencyMetrics: LatencyMetrics
 
+class SimulationBatchResponse(BaseModel):
+    orderSizes: List[float]
+    slippage: List[float]
+    marketImpact: List[float]
+    fees: List[float]
+    netTransactionCost: List[float]
+    makerTakerProbability: List[float]
+    processingLatency: float
+    latencyMetrics: LatencyMetrics
+
 # Helper functions for models
-def calculate_slippage(orderbook: OrderbookData, order_size: float) -> float:
-    """Calculate expected slippage using a simple linear model"""
-    # Extract bid/ask prices and sizes
-    if order_size <= 0:
-        return 0.0
-    
-    # For a buy order, we look at the ask side
-    remaining_size = order_size
-    total_cost = 0.0
-    mid_price = (orderbook.asks[0].price + orderbook.bids[0].price) / 2
-    
-    for ask in orderbook.asks:
-        if remaining_size <= 0:
-            break
-        
-        filled_size = min(remaining_size, ask.size)
-        total_cost += filled_size * ask.price
-        remaining_size -= filled_size
+# Prices stay float64: float32 steps at BTC prices are a sizeable fraction of a tick
+# and would distort slippage. Sizes and totals are stored as float32 to cut the
+# memory scanned per request; the kernels accumulate them in float64
+PRICE_DTYPE = np.float64
+ORDERBOOK_DTYPE = np.float32
+
+def _to_soa(entries: List[OrderbookEntry]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert a list of orderbook entries into contiguous price, size and total arrays"""
+    count = len(entries)
+    prices = np.fromiter((entry.price for entry in entries), dtype=PRICE_DTYPE, count=count)
+    sizes = np.fromiter((entry.size for entry in entries), dtype=ORDERBOOK_DTYPE, count=count)
+    totals = np.fromiter((entry.total for entry in entries), dtype=ORDERBOOK_DTYPE, count=count)
+    return prices, sizes, totals
+
+# Maker/taker logistic model coefficients (would be trained in a real model)
+MAKER_TAKER_B0 = -0.5
+MAKER_TAKER_B1 = 2.0   # Higher spread increases maker probability
+MAKER_TAKER_B2 = 0.01  # More depth slightly increases maker probability
+MAKER_TAKER_B3 = 0.5   # Higher liquidity ratio increases maker probability
+MAKER_TAKER_B4 = -0.1  # Larger order size decreases maker probability
+
+@njit(cache=True, fastmath=True, nogil=True)
+def calculate_maker_taker_probability(spread: float, book_depth: int, liquidity_ratio: float, order_size: float) -> float:
+    """Calculate probability of order being filled as maker vs taker using logistic model"""
+    # Simplified logistic function
+    # P(maker) = 1 / (1 + exp(-z))
+    # where z = b0 + b1*spread + b2*book_depth + b3*liquidity_ratio + b4*order_size
     
-    # If we couldn't fill the entire order with the available liquidity
-    if remaining_size > 0:
-        # Assume a 2% premium for the remaining size as a penalty
-        total_cost += remaining_size * orderbook.asks[-1].price * 1.02
+    # Normalize inputs
+    norm_spread = min(spread / 10.0, 1.0)  # Assume max relevant spread is 10
+    norm_depth = min(book_depth / 100.0, 1.0)  # Normalize depth
+    norm_liquidity = min(liquidity_ratio, 2.0) / 2.0  # Cap at 2.0
+    norm_order_size = min(order_size / 10.0, 1.0)  # Assume 10 BTC is large
     
-    avg_execution_price = total_cost / order_size
-    slippage_percentage = (avg_execution_price / mid_price - 1) * 100
+    # Calculate logistic function input
+    z = (MAKER_TAKER_B0 + MAKER_TAKER_B1*norm_spread + MAKER_TAKER_B2*norm_depth
+         + MAKER_TAKER_B3*norm_liquidity + MAKER_TAKER_B4*norm_order_size)
     
-    return slippage_percentage
+    # Calculate probability; 1 / (1 + exp(-z)) == 0.5 * (1 + tanh(z / 2)), which
+    # needs no division and cannot overflow for large |z|
+    return 0.5 * (1.0 + math.tanh(0.5 * z))
 
-def calculate_market_impact(orderbook: OrderbookData, order_size: float, volatility: float = 0.02) -> float:
+@njit(cache=True, fastmath=True, nogil=True)
+def calculate_market_impact(book_total: float, order_size: float, volatility: float) -> float:
     """Calculate market impact using a simplified Almgren-Chriss model"""
-    # Simplified Almgren-Chriss model
     # Impact = σ * sqrt(order_size / daily_volume) * sqrt(urgency)
     
     # Estimate daily volume from orderbook depth as a proxy
-    estimated_daily_volume = sum(bid.total for bid in orderbook.bids) + sum(ask.total for ask in orderbook.asks)
-    estimated_daily_volume *= 24  # Scale up to represent a full day
+    estimated_daily_volume = book_total * 24  # Scale up to represent a full day
     
     # Avoid division by zero
     if estimated_daily_volume == 0:
@@ -115,115 +230,330 @@ def calculate_market_impact(orderbook: OrderbookData, order_size: float, volatil
     # Urgency factor (higher means more urgent execution)
     urgency_factor = 1.0
     
-    # Calculate impact
-    impact = volatility * np.sqrt(order_size / estimated_daily_volume) * np.sqrt(urgency_factor)
+    impact = volatility * math.sqrt(order_size / estimated_daily_volume) * math.sqrt(urgency_factor)
+    return impact * 100  # Convert to percentage
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _book_features(
+    ask_sizes: np.ndarray,
+    ask_totals: np.ndarray,
+    bid_sizes: np.ndarray,
+    bid_totals: np.ndarray,
+) -> Tuple[float, float, int]:
+    """Reduce the book to the inputs of the impact and maker/taker models (compiled with Numba)
+    
+    Returns (book_total, liquidity_ratio, book_depth).
+    """
+    # Plain reductions so LLVM can vectorize them; one accumulator over both
+    # sides for the market impact depth
+    book_total = 0.0
+    ask_size_sum = 0.0
+    bid_size_sum = 0.0
+    
+    for i in range(ask_sizes.shape[0]):
+        book_total += ask_totals[i]
+        ask_size_sum += ask_sizes[i]
     
-    # Convert to percentage
-    impact_percentage = impact * 100
+    for i in range(bid_sizes.shape[0]):
+        book_total += bid_totals[i]
+        bid_size_sum += bid_sizes[i]
     
-    return impact_percentage
+    liquidity_ratio = bid_size_sum / max(ask_size_sum, 0.001)
+    book_depth = bid_sizes.shape[0] + ask_sizes.shape[0]
+    return book_total, liquidity_ratio, book_depth
 
-def calculate_fees(order_size: float, fee_tier: str) -> float:
-    """Calculate trading fees based on fee tier"""
-    fee_rates = {
-        "standard": 0.001,  # 0.1%
-        "vip1": 0.0008,    # 0.08%
-        "vip2": 0.0006,    # 0.06%
-        "vip3": 0.0004,    # 0.04%
-        "vip": 0.0005      # 0.05%
-    }
+@njit(cache=True, fastmath=True, nogil=True)
+def _simulate_kernel(
+    ask_prices: np.ndarray,
+    ask_sizes: np.ndarray,
+    ask_totals: np.ndarray,
+    bid_prices: np.ndarray,
+    bid_sizes: np.ndarray,
+    bid_totals: np.ndarray,
+    spread: float,
+    best_ask: float,
+    mid_price: float,
+    order_size: float,
+    volatility: float,
+) -> Tuple[float, float, float]:
+    """Compute slippage, market impact and maker/taker probability for one order (compiled with Numba)
+    
+    Returns (slippage, market_impact, maker_taker_probability).
+    """
+    book_total, liquidity_ratio, book_depth = _book_features(ask_sizes, ask_totals, bid_sizes, bid_totals)
+    
+    # Expected slippage: for a buy order, walk the ask side
+    if order_size <= 0:
+        slippage = 0.0
+    else:
+        if order_size <= ask_sizes[0]:
+            # Common case: the whole order fills at the best ask
+            avg_execution_price = best_ask
+        else:
+            remaining_size = order_size
+            total_cost = 0.0
+            
+            for i in range(ask_prices.shape[0]):
+                if remaining_size <= 0:
+                    break
+                
+                filled_size = min(remaining_size, ask_sizes[i])
+                total_cost += filled_size * ask_prices[i]
+                remaining_size -= filled_size
+            
+            # If we couldn't fill the entire order with the available liquidity
+            if remaining_size > 0:
+                # Assume a 2% premium for the remaining size as a penalty
+                total_cost += remaining_size * ask_prices[-1] * 1.02
+            
+            avg_execution_price = total_cost / order_size
+        
+        slippage = (avg_execution_price / mid_price - 1) * 100
+    
+    market_impact = calculate_market_impact(book_total, order_size, volatility)
+    maker_taker_probability = calculate_maker_taker_probability(spread, book_depth, liquidity_ratio, order_size)
     
-    rate = fee_rates.get(fee_tier.lower(), 0.001)  # Default to standard rate
-    return order_size * rate
+    return slippage, market_impact, maker_taker_probability
 
-def calculate_maker_taker_probability(orderbook: OrderbookData, order_size: float) -> float:
-    """Calculate probability of order being filled as maker vs taker using logistic model"""
-    # Features for logistic model
-    spread = orderbook.spread
-    book_depth = len(orderbook.bids) + len(orderbook.asks)
-    liquidity_ratio = sum(bid.size for bid in orderbook.bids) / max(sum(ask.size for ask in orderbook.asks), 0.001)
+@njit(cache=True, fastmath=True, nogil=True)
+def _simulate_batch_kernel(
+    ask_prices: np.ndarray,
+    ask_sizes: np.ndarray,
+    ask_totals: np.ndarray,
+    bid_prices: np.ndarray,
+    bid_sizes: np.ndarray,
+    bid_totals: np.ndarray,
+    spread: float,
+    best_ask: float,
+    mid_price: float,
+    order_sizes: np.ndarray,
+    volatility: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute slippage, market impact and maker/taker probability for many order sizes against one book (compiled with Numba)
     
-    # Simplified logistic function
-    # P(maker) = 1 / (1 + exp(-z))
-    # where z = b0 + b1*spread + b2*book_depth + b3*liquidity_ratio + b4*order_size
+    Returns (slippage, market_impact, maker_taker_probability) arrays aligned with order_sizes.
+    """
+    # Cumulative ask size and cost are shared by every order size; the level
+    # each order completes on is then a binary search instead of a walk
+    cum_sizes = np.cumsum(ask_sizes.astype(np.float64))
+    cum_costs = np.cumsum(ask_prices * ask_sizes)
+    fill_indices = np.searchsorted(cum_sizes, order_sizes)
     
-    # Coefficients (would be trained in a real model)
-    b0 = -0.5
-    b1 = 2.0   # Higher spread increases maker probability
-    b2 = 0.01  # More depth slightly increases maker probability
-    b3 = 0.5   # Higher liquidity ratio increases maker probability
-    b4 = -0.1  # Larger order size decreases maker probability
+    book_total, liquidity_ratio, book_depth = _book_features(ask_sizes, ask_totals, bid_sizes, bid_totals)
     
-    # Normalize inputs
-    norm_spread = min(spread / 10.0, 1.0)  # Assume max relevant spread is 10
-    norm_depth = min(book_depth / 100.0, 1.0)  # Normalize depth
-    norm_liquidity = min(liquidity_ratio, 2.0) / 2.0  # Cap at 2.0
-    norm_order_size = min(order_size / 10.0, 1.0)  # Assume 10 BTC is large
+    count = order_sizes.shape[0]
+    slippage = np.zeros(count)
+    market_impact = np.empty(count)
+    maker_taker_probability = np.empty(count)
     
-    # Calculate logistic function input
-    z = b0 + b1*norm_spread + b2*norm_depth + b3*norm_liquidity + b4*norm_order_size
+    for j in range(count):
+        order_size = order_sizes[j]
+        fill_index = fill_indices[j]
+        
+        if order_size > 0:
+            if fill_index == 0:
+                # The whole order fills at the best ask
+                avg_execution_price = best_ask
+            elif fill_index < cum_sizes.shape[0]:
+                total_cost = cum_costs[fill_index - 1] + (order_size - cum_sizes[fill_index - 1]) * ask_prices[fill_index]
+                avg_execution_price = total_cost / order_size
+            else:
+                # Assume a 2% premium for the size beyond the available liquidity
+                total_cost = cum_costs[-1] + (order_size - cum_sizes[-1]) * ask_prices[-1] * 1.02
+                avg_execution_price = total_cost / order_size
+            
+            slippage[j] = (avg_execution_price / mid_price - 1) * 100
+        
+        market_impact[j] = calculate_market_impact(book_total, order_size, volatility)
+        maker_taker_probability[j] = calculate_maker_taker_probability(spread, book_depth, liquidity_ratio, order_size)
+    
+    return slippage, market_impact, maker_taker_probability
+
+def warm_up_kernels() -> None:
+    """Compile the kernels for the dtypes the endpoints pass them"""
+    prices = np.ones(1, dtype=PRICE_DTYPE)
+    book = np.ones(1, dtype=ORDERBOOK_DTYPE)
+    _simulate_kernel(prices, book, book, prices, book, book, 1.0, 1.0, 1.0, 1.0, 0.02)
+    _simulate_batch_kernel(prices, book, book, prices, book, book, 1.0, 1.0, 1.0, np.ones(1), 0.02)
+
+FEE_RATES = MappingProxyType({
+    FeeTier.STANDARD: 0.001,  # 0.1%
+    FeeTier.BASIC: 0.001,     # 0.1%
+    FeeTier.VIP1: 0.0008,     # 0.08%
+    FeeTier.VIP2: 0.0006,     # 0.06%
+    FeeTier.VIP3: 0.0004,     # 0.04%
+    FeeTier.VIP: 0.0005       # 0.05%
+})
+
+# Model results are deliberately not memoized. Slippage, market impact and the
+# maker/taker features depend on the whole book, which changes with every update,
+# so cache keys would almost never repeat (and rounding inputs to make them repeat
+# changes the outputs). Fees are the only book-independent result, and a single
+# multiply is cheaper than a cache lookup.
+def calculate_fees(order_size: float, fee_tier: FeeTier) -> float:
+    """Calculate trading fees based on fee tier"""
+    return order_size * FEE_RATES[fee_tier]
+
+class PreparedOrderbook(NamedTuple):
+    """Orderbook arrays and top-of-book scalars, in the kernels' leading argument order"""
+    ask_prices: np.ndarray
+    ask_sizes: np.ndarray
+    ask_totals: np.ndarray
+    bid_prices: np.ndarray
+    bid_sizes: np.ndarray
+    bid_totals: np.ndarray
+    spread: float
+    best_ask: float
+    mid_price: float
+
+def prepare_simulation(request: Any) -> Tuple[PreparedOrderbook, float]:
+    """Convert a (single or batch) simulation request into kernel inputs
     
-    # Calculate probability
-    maker_probability = 1.0 / (1.0 + np.exp(-z))
+    Returns (book, volatility).
+    """
+    orderbook = request.orderbook
+    parameters = request.parameters
     
-    return maker_probability
+    # Convert the orderbook once into arrays shared by all models
+    bid_prices, bid_sizes, bid_totals = _to_soa(orderbook.bids)
+    ask_prices, ask_sizes, ask_totals = _to_soa(orderbook.asks)
+    
+    # Top of book, read once from the request rather than from the arrays
+    best_ask = orderbook.asks[0].price
+    best_bid = orderbook.bids[0].price
+    mid_price = 0.5 * (best_ask + best_bid)
+    
+    book = PreparedOrderbook(
+        ask_prices, ask_sizes, ask_totals,
+        bid_prices, bid_sizes, bid_totals,
+        orderbook.spread, best_ask, mid_price,
+    )
+    
+    # Use default volatility if not provided
+    volatility = parameters.volatility if parameters.volatility is not None else 0.02
+    
+    return book, volatility
 
-@app.get("/")
-async def root():
-    return {"message": "GoQuant Trade Simulator API"}
+def compute_simulation_metrics(request: SimulationRequest) -> Dict[str, float]:
+    """Run all models for a simulation request, keyed by response field"""
+    book, volatility = prepare_simulation(request)
+    order_size = request.parameters.orderSize
+    
+    # Calculate metrics
+    slippage, market_impact, maker_taker_prob = _simulate_kernel(*book, order_size, volatility)
+    fees = calculate_fees(order_size, request.parameters.feeTier)
+    
+    return {
+        "slippage": slippage,
+        "marketImpact": market_impact,
+        "fees": fees,
+        # Calculate net transaction cost
+        "netTransactionCost": (slippage + market_impact + fees) / 100 * order_size,
+        "makerTakerProbability": maker_taker_prob,
+    }
 
-@app.post("/simulate", response_model=SimulationResponse)
-async def simulate_trade(request: SimulationRequest):
-    # Start timing server processing
-    server_start_time = time.time()
+def compute_batch_metrics(request: SimulationBatchRequest) -> Dict[str, np.ndarray]:
+    """Run all models for every order size in a batch request, keyed by response field"""
+    book, volatility = prepare_simulation(request)
+    order_sizes = np.asarray(request.orderSizes, dtype=np.float64)
+    
+    slippage, market_impact, maker_taker_prob = _simulate_batch_kernel(*book, order_sizes, volatility)
+    fees = order_sizes * FEE_RATES[request.parameters.feeTier]
+    
+    return {
+        "orderSizes": order_sizes,
+        "slippage": slippage,
+        "marketImpact": market_impact,
+        "fees": fees,
+        "netTransactionCost": (slippage + market_impact + fees) / 100 * order_sizes,
+        "makerTakerProbability": maker_taker_prob,
+    }
+
+async def decode_request(decoder: msgspec.json.Decoder, raw_request: Request) -> Any:
+    """Decode a request body, mapping msgspec errors to HTTP errors"""
+    try:
+        return decoder.decode(await raw_request.body())
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+async def run_simulation(
+    raw_request: Request,
+    decoder: msgspec.json.Decoder,
+    compute: Callable[[Any], Dict[str, Any]],
+    description: str,
+) -> ORJSONResponse:
+    """Decode a simulation request, run the models on the thread pool and build the timed response"""
+    # Start timing server processing (monotonic clock)
+    server_start_time = time.perf_counter()
+    
+    request = await decode_request(decoder, raw_request)
     
     try:
-        # Extract data
-        orderbook = request.orderbook
-        parameters = request.parameters
         client_timestamp = request.clientTimestamp
         
-        # Calculate metrics
-        slippage = calculate_slippage(orderbook, parameters.orderSize)
-        
-        # Use default volatility if not provided
-        volatility = parameters.volatility if parameters.volatility is not None else 0.02
-        market_impact = calculate_market_impact(orderbook, parameters.orderSize, volatility)
-        
-        fees = calculate_fees(parameters.orderSize, parameters.feeTier)
-        maker_taker_prob = calculate_maker_taker_probability(orderbook, parameters.orderSize)
-        
-        # Calculate net transaction cost
-        net_cost = (slippage + market_impact + fees) / 100 * parameters.orderSize
+        # Calculate metrics on the thread pool (the loop's default executor if the
+        # app was started without its lifespan)
+        cpu_pool = getattr(raw_request.app.state, "cpu_pool", None)
+        loop = asyncio.get_running_loop()
+        metrics = await loop.run_in_executor(cpu_pool, compute, request)
         
         # Calculate latency metrics
-        server_processing_time = time.time() - server_start_time
+        server_processing_time = time.perf_counter() - server_start_time
+        # Comparing against the client timestamp needs wall-clock time
         total_server_time = time.time() - (client_timestamp / 1000)  # Convert client timestamp to seconds
         
         # Log latency information
-        logger.info(f"Simulation request processed - Server processing time: {server_processing_time*1000:.2f}ms, "  
+        logger.info(f"{description.capitalize()} processed - Server processing time: {server_processing_time*1000:.2f}ms, "
                    f"Total server time: {total_server_time*1000:.2f}ms")
         
-        # Create response
-        response = SimulationResponse(
-            slippage=slippage,
-            marketImpact=market_impact,
-            fees=fees,
-            netTransactionCost=net_cost,
-            processingLatency=server_processing_time * 1000,  # Convert to milliseconds
-            makerTakerProbability=maker_taker_prob,
-            latencyMetrics=LatencyMetrics(
-                serverProcessingTime=server_processing_time * 1000,
-                totalServerTime=total_server_time * 1000
-            )
-        )
-        
-        return response
+        # Create response (same shape as the documented response model, without a Pydantic pass)
+        return ORJSONResponse({
+            **metrics,
+            "processingLatency": server_processing_time * 1000,  # Convert to milliseconds
+            "latencyMetrics": {
+                "serverProcessingTime": server_processing_time * 1000,
+                "totalServerTime": total_server_time * 1000
+            }
+        })
         
     except Exception as e:
-        logger.error(f"Error processing simulation request: {str(e)}")
+        logger.error(f"Error processing {description}: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/")
+async def root():
+    return {"message": "GoQuant Trade Simulator API"}
+
+@app.post(
+    "/simulate",
+    # The body is built as a plain dict below; the model is only used for the docs
+    responses={200: {"model": SimulationResponse}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": simulation_request_schema}},
+        }
+    },
+)
+async def simulate_trade(raw_request: Request):
+    return await run_simulation(raw_request, simulation_request_decoder, compute_simulation_metrics, "simulation request")
+
+@app.post(
+    "/simulate_batch",
+    responses={200: {"model": SimulationBatchResponse}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": simulation_batch_request_schema}},
+        }
+    },
+)
+async def simulate_trade_batch(raw_request: Request):
+    # Columnar response; orjson serializes the NumPy arrays directly
+    return await run_simulation(raw_request, simulation_batch_request_decoder, compute_batch_metrics, "batch simulation request")
+
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
     start_time = time.time()
@@ -234,4 +564,9 @@ async def add_process_time_header(request: Request, call_next):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # One worker process per available core, each with its own GIL; the kernels are
+    # compiled (or loaded from Numba's on-disk cache) when each worker starts up
+    workers = int(os.environ.get("WEB_CONCURRENCY", available_cpus()))
+    # Workers read this back to size their CPU pool
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, workers=workers)